@@ -2,68 +2,343 @@ import io
 import os
 import json
 import datetime
-from flask import Flask, request, jsonify, send_from_directory, Response
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.lib.units import inch
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer,
-    Table, TableStyle, Image, PageBreak
-)
+import posixpath
+from flask import Flask, request, jsonify, send_from_directory
 import shutil
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
 from werkzeug.exceptions import RequestEntityTooLarge
 import zipfile
 import tempfile
 from flask_cors import CORS
-from reportlab.lib.styles import ParagraphStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-from pdf_styles import get_pdf_styles
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 from pdf_generator import generate_validation_report_pdf
 
 
 from automation_for_app import (
-    check_osc_duplicates, check_invalid_cable_refs,
+    ShapefileCache, check_osc_duplicates, check_invalid_cable_refs,
     report_splice_counts_by_closure, process_shapefiles,
     check_gistool_id, check_cluster_overlaps, check_granularity_fields, 
     validate_non_virtual_closures, validate_feeder_primdistribution_locations,
     validate_cable_diameters
 )
 
-app = Flask(__name__, static_folder='build', static_url_path='')
+try:
+    import orjson
+except ImportError:
+    orjson = None
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter
+json_loads = orjson.loads if orjson else json.loads
+
+# Mapping of check names to functions
+CHECK_FUNCTIONS = {
+    "OSC Duplicates Check": check_osc_duplicates,
+    "Cluster Overlap Check": check_cluster_overlaps,
+    "Cable Granularity Check": check_granularity_fields,
+    "Non-virtual Closure Validation": validate_non_virtual_closures,
+    "Point Location Validation": validate_feeder_primdistribution_locations,
+    "Cable Diameter Validation": validate_cable_diameters,
+    "Cable Reference Validation": check_invalid_cable_refs,
+    "Shapefile Processing": process_shapefiles,
+    "GISTOOL_ID Validation": check_gistool_id,
+    "Splice Count Report": report_splice_counts_by_closure
+}
+
+# Checks run when the request does not select any
+DEFAULT_CHECKS = tuple(CHECK_FUNCTIONS)
+
+# 'thread' (default) runs checks in threads sharing a ShapefileCache;
+# 'process' runs them in a process pool sized to the CPU count
+CHECK_EXECUTOR = os.environ.get('CHECK_EXECUTOR', 'thread').lower()
+
+_check_pool = None
+_check_pool_lock = threading.Lock()
+
+
+def _check_process_pool():
+    """Create the check process pool on first use (after gunicorn has forked)"""
+    global _check_pool
+    with _check_pool_lock:
+        if _check_pool is None:
+            _check_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _check_pool
+
+
+def _run_check(check_name, workspace):
+    """Run a check by name; the function is looked up inside the worker process"""
+    return CHECK_FUNCTIONS[check_name](workspace)
+
+
+def _safe_result(future):
+    """(status, message) of a finished check, turning exceptions into an error result"""
+    try:
+        status, message = future.result()
+        return status, message
+    except Exception as e:
+        return None, f"Error running check: {str(e)}"
+
+
+def _collect_check_results(futures):
+    """Map check name -> [name, status, message], waking once when all checks are done"""
+    done, _ = wait(futures)
+    return {futures[f]: [futures[f], *_safe_result(f)] for f in done}
+
+STATIC_ASSET_MAX_AGE = 365 * 24 * 3600  # Build bundles under static/ have hashed names
+
+
+class ReactFlask(Flask):
+    """Flask app that lets browsers cache the hashed React build bundles"""
+
+    def get_send_file_max_age(self, filename):
+        if filename and filename.replace(os.sep, '/').startswith('static/'):
+            return STATIC_ASSET_MAX_AGE
+        return super().get_send_file_max_age(filename)
+
+
+app = ReactFlask(__name__, static_folder='build', static_url_path='')
 CORS(app)  # Enable CORS for React frontend
 app.config['MAX_CONTENT_LENGTH'] = 500 * 1024 * 1024  # Increased to 500MB
 app.config['UPLOAD_FOLDER'] = tempfile.gettempdir()
+# Let a fronting proxy (nginx X-Accel/Apache X-Sendfile) deliver static files
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+# Compress JSON results and HTML when flask-compress is installed
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+app.config['COMPRESS_LEVEL'] = 5
+if Compress is not None:
+    Compress(app)
+
+
+def json_response(payload):
+    """JSON response serialized with orjson when available (falls back to jsonify)"""
+    if orjson is None:
+        return jsonify(payload)
+    return app.response_class(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        mimetype='application/json'
+    )
+
+ZIP_CHUNK_SIZE = 1024 * 1024  # Copy ZIP members 1MB at a time
+# Preallocation trusts the ZIP header only this far: at most this many times the
+# compressed size, and never more than PREALLOCATE_MAX bytes per member
+PREALLOCATE_RATIO = 20
+PREALLOCATE_MAX = 256 * 1024 * 1024
+# Shapefile components read by the checks; other members (logs, XML, images) are skipped
+SHAPEFILE_EXTENSIONS = {'.shp', '.shx', '.dbf', '.prj', '.cpg'}
+# Set EXTRACT_ALL_FILES=1 to extract every member of the output folder (debugging)
+EXTRACT_ALL_FILES = os.environ.get('EXTRACT_ALL_FILES', '').lower() in ('1', 'true', 'yes')
+MAX_CHECK_WORKERS = 8  # Upper bound on checks running at the same time
+MAX_TREE_ENTRIES = 200  # Entries listed when the output folder cannot be found
+# Extraction directories live on tmpfs where available
+SCRATCH_ROOT = os.environ.get(
+    'SCRATCH_ROOT',
+    '/dev/shm/comsof' if os.path.isdir('/dev/shm') else os.path.join(tempfile.gettempdir(), 'comsof')
+)
+SCRATCH_POOL_SIZE = int(os.environ.get('SCRATCH_POOL_SIZE', '4'))
+
+
+class ScratchPool:
+    """
+    Reusable extraction directories under SCRATCH_ROOT (RAM-backed on Linux).
+    Directories are emptied on release and handed out again, avoiding mkdir/rmdir
+    churn. Falls back to tempfile.mkdtemp when the root is unusable or too full.
+    """
+
+    def __init__(self, root, size):
+        # Normalised once, so release() recognises pooled directories however
+        # SCRATCH_ROOT was written (trailing slash, symlinks)
+        self.root = os.path.realpath(root)
+        self.size = size
+        self._free = queue.Queue()
+
+    def _root_available(self, size_hint):
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            return shutil.disk_usage(self.root).free > size_hint
+        except OSError:
+            return False
+
+    def acquire(self, size_hint=0):
+        """Return an empty directory with room for roughly size_hint bytes"""
+        if not self._root_available(size_hint):
+            return tempfile.mkdtemp()
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            return tempfile.mkdtemp(prefix='scratch-', dir=self.root)
+
+    def release(self, path):
+        """Empty the directory and keep it for reuse (or remove it if the pool is full)"""
+        pooled = os.path.dirname(path) == self.root
+        try:
+            _clear_dir(path)
+        except OSError:
+            shutil.rmtree(path, ignore_errors=True)
+            return
+        if pooled and self._free.qsize() < self.size:
+            self._free.put(path)
+        else:
+            os.rmdir(path)
+
+    def release_async(self, path):
+        """Release the directory on a background thread, off the response path"""
+        threading.Thread(target=self._release_logged, args=(path,), daemon=True).start()
+
+    def _release_logged(self, path):
+        try:
+            self.release(path)
+        except Exception as e:
+            app.logger.error(f"Cleanup error: {e}")
+
+
+def _clear_dir(path):
+    """Delete everything inside path, using scandir's d_type instead of extra stat() calls"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _clear_dir(entry.path)
+                os.rmdir(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+SCRATCH = ScratchPool(SCRATCH_ROOT, SCRATCH_POOL_SIZE)
+
+
+def _safe_join(base, member):
+    """Resolve a ZIP member path under base, rejecting paths that escape it"""
+    base = os.path.realpath(base)
+    target = os.path.realpath(os.path.join(base, member))
+    if os.path.commonpath([base, target]) != base:
+        raise ValueError(f"Unsafe path in ZIP archive: {member}")
+    return target
+
+
+def _preallocate(fileobj, info):
+    """
+    Reserve the member's size for fileobj up front so the filesystem allocates it
+    in one go. The declared size is capped, since a crafted archive could otherwise
+    reserve scratch space (tmpfs RAM) before a byte is decompressed; anything past
+    the cap is allocated by the writes as usual.
+    """
+    size = min(info.file_size, info.compress_size * PREALLOCATE_RATIO, PREALLOCATE_MAX)
+    if size > 0 and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fileobj.fileno(), 0, size)
+        except OSError:
+            pass  # Not supported by this filesystem; the writes allocate as they go
+
+
+def _find_workspace(names):
+    """
+    Locate the output directory from the archive member names.
+    Returns the directory as a relative POSIX path ('' for the archive root),
+    or None if no output directory was found.
+    """
+    # Fast path: a single MRO_* folder with an output/ folder inside (the usual layout)
+    mro_dirs = {name.split('/', 1)[0] for name in names if name.startswith('MRO_') and '/' in name}
+    if len(mro_dirs) == 1:
+        output_prefix = next(iter(mro_dirs)) + '/output/'
+        if any(name.startswith(output_prefix) for name in names):
+            return output_prefix.rstrip('/')
+
+    dirs = set()
+    closure_dirs = []
+    for name in names:
+        parts = name.rstrip('/').split('/')
+        depth = len(parts) if name.endswith('/') else len(parts) - 1
+        for i in range(1, depth + 1):
+            dirs.add('/'.join(parts[:i]))
+        if not name.endswith('/') and parts[-1] == 'OUT_Closures.shp':
+            closure_dirs.append('/'.join(parts[:-1]))
 
-def extract_zip(zip_path, extract_to):
-    """Extract zip file and find the output directory"""
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_to)
-    
-    # Look for the output directory in the expected structure
-    base_dir = None
-    
     # 1. Check for MRO_* directories
-    for name in os.listdir(extract_to):
-        if name.startswith('MRO_') and os.path.isdir(os.path.join(extract_to, name)):
-            base_dir = os.path.join(extract_to, name)
-            break
-    
-    # 2. If no MRO_* directory found, check for output directly
-    if not base_dir:
-        base_dir = extract_to
-    
-    # 3. Look for output directory
-    output_dir = os.path.join(base_dir, 'output')
-    if os.path.exists(output_dir) and os.path.isdir(output_dir):
+    base_dir = next((d for d in sorted(dirs) if '/' not in d and d.startswith('MRO_')), '')
+
+    # 2. Look for output directory
+    output_dir = posixpath.join(base_dir, 'output')
+    if output_dir in dirs:
         return output_dir
-    
-    # 4. Fallback: check if any subdirectory contains OUT_Closures.shp
-    for root, dirs, files in os.walk(base_dir):
-        if 'OUT_Closures.shp' in files:
-            return root
-    
+
+    # 3. Fallback: any directory below the base containing OUT_Closures.shp
+    candidates = [
+        d for d in closure_dirs
+        if not base_dir or d == base_dir or d.startswith(base_dir + '/')
+    ]
+    if candidates:
+        return min(candidates, key=lambda d: (d.count('/'), d))
     return None
 
+
+def _format_tree(names, root_name, limit=None):
+    """Render archive member names as an indented directory tree (no filesystem access)"""
+    limit = MAX_TREE_ENTRIES if limit is None else limit
+    entries = set()
+    for name in names:
+        parts = tuple(p for p in name.split('/') if p)
+        for i in range(1, len(parts)):
+            entries.add((parts[:i], True))
+        if parts:
+            entries.add((parts, name.endswith('/')))
+
+    tree = [f'{root_name}/']
+    ordered = sorted(entries)
+    for parts, is_dir in ordered[:limit]:
+        indent = ' ' * 4 * len(parts)
+        tree.append(f"{indent}{parts[-1]}{'/' if is_dir else ''}")
+    if len(ordered) > limit:
+        tree.append(f'... ({len(ordered) - limit} more entries not shown)')
+    return tree
+
+
+def _plan_extraction(zip_ref):
+    """
+    Find the output directory from the ZIP index and the members to extract from it:
+    its directories and shapefile components (every file with EXTRACT_ALL_FILES).
+    Returns (output directory or None, list of ZipInfo).
+    """
+    infos = zip_ref.infolist()
+    workspace = _find_workspace([info.filename for info in infos])
+    if workspace is None:
+        return None, []
+
+    prefix = workspace + '/' if workspace else ''
+    members = [
+        info for info in infos
+        if info.filename.startswith(prefix) and (
+            info.is_dir() or EXTRACT_ALL_FILES or
+            posixpath.splitext(info.filename)[1].lower() in SHAPEFILE_EXTENSIONS
+        )
+    ]
+    return workspace, members
+
+
+def extract_zip(zip_ref, workspace, members, extract_to):
+    """
+    Extract the members chosen by _plan_extraction into extract_to.
+    Returns the extracted output directory.
+    """
+    for info in members:
+        target = _safe_join(extract_to, info.filename)
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with zip_ref.open(info) as src, open(target, 'wb') as dst:
+            _preallocate(dst, info)
+            shutil.copyfileobj(src, dst, ZIP_CHUNK_SIZE)
+
+    if workspace:
+        return os.path.join(extract_to, *workspace.split('/'))
+    return extract_to
+
 # Handle file too large error
 @app.errorhandler(RequestEntityTooLarge)
 def handle_file_too_large(error):
@@ -74,6 +349,7 @@ def handle_file_too_large(error):
 @app.route('/validate', methods=['POST'])
 def validate():
     """API endpoint for validation"""
+    extract_dir = None
     try:
         # Check if file is in request
         if 'file' not in request.files:
@@ -90,94 +366,65 @@ def validate():
         if not file.filename.endswith('.zip'):
             return jsonify({'error': 'File must be a ZIP archive'}), 400
         
-        # Additional file size check before processing
-        file.seek(0, 2)  # Seek to end
-        file_size = file.tell()
-        file.seek(0)  # Reset to beginning
+        # Additional file size check before processing; Content-Length avoids seeking
+        # through the upload (MAX_CONTENT_LENGTH still guards clients that lie about it)
+        file_size = request.content_length or 0
         
         if file_size > 500 * 1024 * 1024:  # 500MB
             return jsonify({
                 'error': f'File too large ({file_size / (1024*1024):.1f}MB). Maximum size is 500MB.'
             }), 413
         
-        # Save uploaded file
-        zip_path = os.path.join(app.config['UPLOAD_FOLDER'], file.filename)
-        file.save(zip_path)
+        # Werkzeug has already spooled the upload (to disk past 500KB), so the ZIP
+        # is read straight from its seekable stream instead of being copied again
+        with zipfile.ZipFile(file.stream, 'r') as zip_ref:
+            workspace, members = _plan_extraction(zip_ref)
+            if workspace is not None:
+                # Take a scratch directory with room for the uncompressed members
+                extract_dir = SCRATCH.acquire(size_hint=sum(info.file_size for info in members))
+                workspace = extract_zip(zip_ref, workspace, members, extract_dir)
         
-        # Create temp directory for extraction
-        extract_dir = tempfile.mkdtemp()
-        workspace = extract_zip(zip_path, extract_dir)
-        
-        if not workspace:
-            # Generate directory tree for debugging
-            tree = []
-            for root, dirs, files in os.walk(extract_dir):
-                level = root.replace(extract_dir, '').count(os.sep)
-                indent = ' ' * 4 * level
-                tree.append(f'{indent}{os.path.basename(root)}/')
-                subindent = ' ' * 4 * (level + 1)
-                for f in files:
-                    tree.append(f'{subindent}{f}')
-            
-            # Cleanup
-            try:
-                os.remove(zip_path)
-                shutil.rmtree(extract_dir)
-            except:
-                pass
+        if workspace is None:
+            # Generate directory tree for debugging from the archive listing
+            tree = _format_tree(zip_ref.namelist(), os.path.splitext(file.filename)[0])
             
             return jsonify({
                 'error': f"Could not find output folder in ZIP structure. Directory structure:\n{chr(10).join(tree)}"
             }), 400
         
-                # Get selected checks from form data
-        checks_json = request.form.get('checks', '[]')
+        # Get selected checks from form data; default to all checks
         try:
-            selected_checks = json.loads(checks_json)
+            selected_checks = json_loads(request.form.get('checks') or '[]')
         except json.JSONDecodeError:
             selected_checks = []
-        
-        # If no checks selected, use all checks as default
         if not selected_checks:
-            selected_checks = [
-                "OSC Duplicates Check",
-                "Cluster Overlap Check",
-                "Cable Granularity Check",
-                "Non-virtual Closure Validation",
-                "Point Location Validation",
-                "Cable Diameter Validation",
-                "Cable Reference Validation",
-                "Shapefile Processing",
-                "GISTOOL_ID Validation",
-                "Splice Count Report"
-            ]
-        
-        # Mapping of check names to functions
-        CHECK_FUNCTIONS = {
-            "OSC Duplicates Check": check_osc_duplicates,
-            "Cluster Overlap Check": check_cluster_overlaps,
-            "Cable Granularity Check": check_granularity_fields,
-            "Non-virtual Closure Validation": validate_non_virtual_closures,
-            "Point Location Validation": validate_feeder_primdistribution_locations,
-            "Cable Diameter Validation": validate_cable_diameters,
-            "Cable Reference Validation": check_invalid_cable_refs,
-            "Shapefile Processing": process_shapefiles,
-            "GISTOOL_ID Validation": check_gistool_id,
-            "Splice Count Report": report_splice_counts_by_closure
-        }
+            selected_checks = DEFAULT_CHECKS
         
-        # Run only selected checks
-        results = []
-        for check_name in selected_checks:
-            if check_name in CHECK_FUNCTIONS:
-                try:
-                    check_func = CHECK_FUNCTIONS[check_name]
-                    status, message = check_func(workspace)
-                    results.append([check_name, status, message])
-                except Exception as e:
-                    results.append([check_name, None, f"Error running check: {str(e)}"])
+        # Run only selected checks, concurrently; results keep the selection order
+        check_results = {}
+        runnable = [name for name in dict.fromkeys(selected_checks) if name in CHECK_FUNCTIONS]
+        if runnable and CHECK_EXECUTOR == 'process':
+            # One process per core for GEOS-heavy checks (no shapefile cache across processes)
+            executor = _check_process_pool()
+            futures = {executor.submit(_run_check, name, workspace): name for name in runnable}
+            check_results = _collect_check_results(futures)
+        elif runnable:
+            # Checks share one shapefile cache so common layers are read once per request
+            cache = ShapefileCache()
+            with ThreadPoolExecutor(max_workers=min(MAX_CHECK_WORKERS, len(runnable))) as executor:
+                futures = {
+                    executor.submit(CHECK_FUNCTIONS[name], workspace, cache=cache): name
+                    for name in runnable
+                }
+                check_results = _collect_check_results(futures)
+            del cache  # Release the cached layers before building the response
+
+        results = [None] * len(selected_checks)
+        for i, check_name in enumerate(selected_checks):
+            if check_name in check_results:
+                results[i] = check_results[check_name]
             else:
-                results.append([check_name, None, "Check function not found"])
+                results[i] = [check_name, None, "Check function not found"]
     
        
         
@@ -203,14 +450,7 @@ def validate():
             except Exception as e:
                 results.append([name, None, f"Error running check: {str(e)}"])'''
         
-        # Cleanup temporary files
-        try:
-            os.remove(zip_path)
-            shutil.rmtree(extract_dir)
-        except Exception as e:
-            app.logger.error(f"Cleanup error: {e}")
-        
-        return jsonify({
+        return json_response({
             'results': results,
             'filename': file.filename
         })
@@ -221,6 +461,10 @@ def validate():
         }), 413
     except Exception as e:
         return jsonify({'error': f'Processing error: {str(e)}'}), 500
+    finally:
+        # Cleanup temporary files in the background, whichever way the request ended
+        if extract_dir is not None:
+            SCRATCH.release_async(extract_dir)
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -270,7 +514,7 @@ def export_pdf():
             sample_result = results[0]
             app.logger.info(f"Sample result: {sample_result}")
 
-        # Generate PDF using the dedicated module
+        # Generate PDF using the dedicated module (identical payloads reuse the rendered bytes)
         return generate_validation_report_pdf(data, app.root_path)
 
     except Exception as exc:
@@ -1,9 +1,38 @@
 import geopandas as gpd
+import pyogrio
 import sys
 import os
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-
-__all__ = ['check_osc_duplicates', 'check_invalid_cable_refs', 'report_splice_counts_by_closure', 'process_shapefiles', 'check_gistool_id', 
+import shapely
+
+try:
+    import pyarrow as pa  # enables pyogrio's Arrow read path
+    USE_ARROW = True
+    # Keep text fields in Arrow buffers instead of one Python str per cell
+    ARROW_STRING_TYPES = {
+        pa.string(): pd.ArrowDtype(pa.string()),
+        pa.large_string(): pd.ArrowDtype(pa.large_string()),
+    }
+except ImportError:
+    USE_ARROW = False
+    ARROW_STRING_TYPES = {}
+
+# Maximum splice limits for each closure type (IDENTIFIER), built once at import
+MAX_SPLICE_LIMITS = {
+    "BE16": 840,
+    "flat_dis": 288,
+    "OFDC": 96,
+    "Budi-S 9-48 HP": 48,
+    "POC_UG_1-8HP": 8,
+    "Budi-S 49-72 HP": 72
+}
+SPLICE_LIMITS = pd.Series(MAX_SPLICE_LIMITS, name="max_limit", dtype=float)
+
+__all__ = ['ShapefileCache', 'check_osc_duplicates', 'check_invalid_cable_refs', 'report_splice_counts_by_closure', 'process_shapefiles', 'check_gistool_id', 
            'check_cluster_overlaps', 'check_granularity_fields', 'validate_non_virtual_closures', 'validate_feeder_primdistribution_locations','validate_cable_diameters']
 
 
@@ -11,12 +40,175 @@ __all__ = ['check_osc_duplicates', 'check_invalid_cable_refs', 'report_splice_co
 ###############################################################################################################
 
 
-def check_osc_duplicates(workspace):
+class ShapefileCache:
+    """
+    Per-request store of parsed shapefiles, so checks that share a layer
+    (e.g. OUT_Closures.shp) read it only once. A request for a column projection
+    is served from any cached frame of the same file that already holds those
+    columns, so a layer is only read again when the projections differ.
+    Safe to share between threads. Cached frames are shared between checks and
+    must not be modified in place.
+    """
+
+    def __init__(self):
+        self._frames = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def read(self, path, columns=None, read_geometry=True, arrow_strings=False):
+        key = (path, frozenset(columns) if columns else None, read_geometry, arrow_strings)
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key in self._frames:
+                return self._frames[key]
+            frame = self._covering(key)
+            if frame is not None:
+                return _project(frame, columns, read_geometry)
+            frame = _read(path, columns=columns, read_geometry=read_geometry, arrow_strings=arrow_strings)
+            with self._lock:
+                self._frames[key] = frame
+            return frame
+
+    def _covering(self, key):
+        """A cached frame of the same file holding every column key asks for"""
+        path, columns, read_geometry, arrow_strings = key
+        with self._lock:
+            entries = list(self._frames.items())
+        for (cached_path, cached_columns, cached_geometry, cached_arrow), frame in entries:
+            if cached_path != path or cached_arrow != arrow_strings or (read_geometry and not cached_geometry):
+                continue
+            if cached_columns is None or (columns is not None and columns <= cached_columns):
+                return frame
+        return None
+
+
+def _project(frame, columns, read_geometry):
+    """Cut a cached frame down to the columns (and geometry) a reader asked for"""
+    geometry = frame.geometry.name if isinstance(frame, gpd.GeoDataFrame) else None
+    if columns:
+        keep = [c for c in frame.columns if c in columns and c != geometry]
+        if read_geometry:
+            keep.append(geometry)
+        frame = frame[keep]
+    if not read_geometry and geometry in frame.columns:
+        frame = pd.DataFrame(frame.drop(columns=geometry))
+    return frame
+
+
+@functools.lru_cache(maxsize=64)
+def _list_workspace(workspace, mtime_ns):
+    with os.scandir(workspace) as entries:
+        return {entry.name: entry.path for entry in entries if entry.is_file()}
+
+
+def _workspace_files(workspace):
+    """
+    Map of file name -> path for the files directly in workspace, from one
+    scandir pass instead of a stat() per existence check. Cached per directory
+    mtime, so a re-extracted workspace is listed again. Do not modify the result.
+    """
+    try:
+        mtime_ns = os.stat(workspace).st_mtime_ns
+    except OSError:
+        return {}
+    return _list_workspace(workspace, mtime_ns)
+
+
+def _read(path, columns=None, where=None, bbox=None, read_geometry=True, arrow_strings=False):
+    """
+    Read a shapefile with pyogrio (GDAL's columnar read path). columns, where and
+    bbox are applied by GDAL, so unneeded fields and rows are never decoded.
+    Returns a pandas DataFrame when read_geometry is False. With arrow_strings,
+    text fields come back Arrow-backed (pd.ArrowDtype) when pyarrow is available;
+    their missing values are pd.NA, so only use it where results are not
+    serialized as-is.
+    """
+    kwargs = {}
+    if arrow_strings and USE_ARROW:
+        kwargs["arrow_to_pandas_kwargs"] = {"types_mapper": ARROW_STRING_TYPES.get}
+    return pyogrio.read_dataframe(
+        path, columns=columns, where=where, bbox=bbox,
+        read_geometry=read_geometry, use_arrow=USE_ARROW, **kwargs
+    )
+
+
+def _read_shapefile(path, cache=None, columns=None, read_geometry=True, arrow_strings=False):
+    """Read a shapefile, going through the cache when one is given"""
+    if cache is None:
+        return _read(path, columns=columns, read_geometry=read_geometry, arrow_strings=arrow_strings)
+    return cache.read(path, columns=columns, read_geometry=read_geometry, arrow_strings=arrow_strings)
+
+
+def _fields(path):
+    """Field names of a shapefile, read from its header only"""
+    return list(pyogrio.read_info(path)["fields"])
+
+
+def _field_dtypes(path):
+    """Field name -> pandas dtype name of a shapefile, read from its header only"""
+    info = pyogrio.read_info(path)
+    return dict(zip(info["fields"], info["dtypes"]))
+
+
+def _read_where(path, where, columns, mask, recheck=True):
+    """
+    Read only the rows matching the OGR SQL where clause, without geometry.
+    OGR compares strings case-insensitively, so mask (DataFrame -> boolean Series)
+    is re-applied to the prefiltered rows; pass recheck=False when the clause
+    only compares numbers and OGR's result is already exact. If OGR rejects the
+    clause, mask is applied to a full read instead.
+    """
+    try:
+        df = _read(path, columns=columns, where=where, read_geometry=False)
+    except ValueError:
+        df = _read(path, columns=columns, read_geometry=False)
+        recheck = True
+    return df[mask(df)] if recheck else df
+
+
+def _iter_column(path, column, batch_size=65536):
+    """
+    Yield one field of a shapefile as pandas Series, a batch of rows at a time,
+    so a large layer is never held in memory whole. Without pyarrow the field
+    is read in a single batch.
+    """
+    if not USE_ARROW:
+        yield _read(path, columns=[column], read_geometry=False)[column]
+        return
+    with pyogrio.raw.open_arrow(
+        path, columns=[column], read_geometry=False, use_pyarrow=True, batch_size=batch_size
+    ) as (meta, reader):
+        if column not in meta["fields"]:
+            raise KeyError(column)
+        for batch in reader:
+            yield batch.column(column).to_pandas()
+
+
+def _map_files(check_one, items):
+    """
+    Run check_one over items on a thread pool, yielding the results in input
+    order. pyogrio releases the GIL while GDAL reads, so per-file reads and
+    GEOS work overlap. An exception is raised when its item's result is
+    reached, so earlier items are still reported.
+    """
+    workers = max(1, min(len(items), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(check_one, item) for item in items]
+        for future in futures:
+            yield future.result()
+
+
+###############################################################################################################
+
+
+def check_osc_duplicates(workspace, cache=None):
     """
     Checks for duplicated ID values in OUT_Closures.shp (which represent OSCs)
     
     Args:
         workspace (str): Path to the directory containing shapefiles
+        cache (ShapefileCache): Optional cache shared with other checks
     
     Returns:
         tuple: (has_issues, json_data) where:
@@ -34,7 +226,7 @@ def check_osc_duplicates(workspace):
     try:
         shapefile_path = os.path.join(workspace, "OUT_Closures.shp")
         
-        if not os.path.isfile(shapefile_path):
+        if "OUT_Closures.shp" not in _workspace_files(workspace):
             result["status"] = "error"
             result["errors"].append({
                 "type": "file_not_found",
@@ -43,7 +235,7 @@ def check_osc_duplicates(workspace):
             })
             return None, result
 
-        gdf = gpd.read_file(shapefile_path)
+        gdf = _read_shapefile(shapefile_path, cache, columns=['ID', 'IDENTIFIER'], read_geometry=False)
         
         # Check for required column
         if 'ID' not in gdf.columns:
@@ -54,8 +246,10 @@ def check_osc_duplicates(workspace):
             })
             return None, result
 
-        # Check for duplicate IDs
-        duplicates = gdf['ID'].duplicated(keep=False)
+        # Count rows per ID in one hashtable pass; IDs seen more than once are duplicates
+        codes, unique_ids = pd.factorize(gdf['ID'], use_na_sentinel=False)
+        id_counts = np.bincount(codes, minlength=len(unique_ids))
+        duplicates = id_counts[codes] > 1
         
         if duplicates.any():
             result["status"] = "failed"
@@ -64,19 +258,18 @@ def check_osc_duplicates(workspace):
                 "has_issues": True
             }
             
-            # Get duplicate values and their counts
-            duplicates_df = gdf[duplicates]['ID'].value_counts().reset_index()
-            duplicates_df.columns = ['OSC ID', 'Duplicate Count']
-            
-            # Add detailed information about duplicates
-            for _, row in duplicates_df.iterrows():
+            # Add detailed information about duplicates, most duplicated first
+            duplicate_counts = pd.Series(id_counts, index=unique_ids)
+            duplicate_counts = duplicate_counts[(duplicate_counts > 1) & duplicate_counts.index.notna()]
+            duplicate_counts = duplicate_counts.sort_values(ascending=False, kind="stable")
+            for osc_id, count in zip(duplicate_counts.index, duplicate_counts.to_numpy()):
                 result["details"].append({
-                    "osc_id": str(row['OSC ID']),
-                    "duplicate_count": int(row['Duplicate Count'])
+                    "osc_id": str(osc_id),
+                    "duplicate_count": int(count)
                 })
             
-            # Add sample of problematic closures
-            problem_closures = gdf[duplicates].head(5)
+            # Add sample of problematic closures, taking only the first 5 duplicate rows
+            problem_closures = gdf.iloc[np.flatnonzero(duplicates)[:5]]
             result["summary"]["sample_closures"] = problem_closures[['ID', 'IDENTIFIER']].to_dict('records')
             
             return True, result
@@ -99,7 +292,7 @@ def check_osc_duplicates(workspace):
     
  ##############################################################################################################   
 
-def process_shapefiles(workspace):
+def process_shapefiles(workspace, cache=None):
     """
     Checks feeder cables and closures without modifying files.
     Reports missing IDENTIFIERs in feeder cables and issues in non-virtual closures.
@@ -111,13 +304,15 @@ def process_shapefiles(workspace):
     output = ["Processing shapefiles: feeder cables and closures"]
     issues_found = False
     try:
+        files = _workspace_files(workspace)
+
         # Check FeederCables identifier issues without modifying
         feeder_path = os.path.join(workspace, "OUT_FeederCables.shp")
-        if not os.path.exists(feeder_path):
+        if "OUT_FeederCables.shp" not in files:
             output.append(f"Error: OUT_FeederCables.shp not found in {workspace}")
             return None, "\n".join(output)
 
-        feeder_gdf = gpd.read_file(feeder_path)
+        feeder_gdf = _read_shapefile(feeder_path, cache, columns=['IDENTIFIER'], read_geometry=False, arrow_strings=True)
         if 'IDENTIFIER' not in feeder_gdf.columns:
             output.append("Feeder cables: 'IDENTIFIER' column missing entirely")
             issues_found = True
@@ -137,11 +332,11 @@ def process_shapefiles(workspace):
 
         # Process Closures
         closures_path = os.path.join(workspace, "OUT_Closures.shp")
-        if not os.path.exists(closures_path):
+        if "OUT_Closures.shp" not in files:
             output.append(f"Error: OUT_Closures.shp not found in {workspace}")
             return None, "\n".join(output)
 
-        closures_gdf = gpd.read_file(closures_path)
+        closures_gdf = _read_shapefile(closures_path, cache, columns=['IDENTIFIER', 'VIRTUAL'], read_geometry=False, arrow_strings=True)
 
         # Check required columns
         missing_cols = [col for col in ('IDENTIFIER', 'VIRTUAL') if col not in closures_gdf.columns]
@@ -172,27 +367,43 @@ def process_shapefiles(workspace):
 
 ###########################################################################################################
 
-def check_gistool_id(workspace):
+def check_gistool_id(workspace, cache=None):
     output = []
     try:
         seg_path = os.path.join(workspace, "OUT_UsedSegments.shp")
-        if not os.path.isfile(seg_path):
+        if "OUT_UsedSegments.shp" not in _workspace_files(workspace):
             output.append(f"Error: OUT_UsedSegments.shp not found in {workspace}")
             return None, "\n".join(output)
         
-        seg_gdf = gpd.read_file(seg_path)
-        
         required_cols = ['TYPE', 'GISTOOL_ID', 'ID']
-        missing_cols = [col for col in required_cols if col not in seg_gdf.columns]
+        field_dtypes = _field_dtypes(seg_path)
+        missing_cols = [col for col in required_cols if col not in field_dtypes]
         if missing_cols:
             output.append(f"Error: Missing required columns: {', '.join(missing_cols)}")
             return None, "\n".join(output)
         
-        aerial_buried_mask = seg_gdf['TYPE'].isin(['AERIAL', 'BURIED'])
-        non_empty_mask = ~seg_gdf['GISTOOL_ID'].isna() & (seg_gdf['GISTOOL_ID'] != '')
-        
-        problem_mask = aerial_buried_mask & non_empty_mask
-        problem_segments = seg_gdf[problem_mask]
+        def problem_mask(seg):
+            # One boolean array, narrowed in place
+            types = seg['TYPE'].to_numpy()
+            gistool_ids = seg['GISTOOL_ID'].to_numpy()
+            mask = types == 'AERIAL'
+            mask |= types == 'BURIED'
+            mask &= pd.notna(gistool_ids)
+            mask &= gistool_ids != ''
+            return mask
+
+        # Only aerial/buried segments with a non-empty GISTOOL_ID are read. The
+        # empty-string test is only pushed down for text fields: OGR coerces ''
+        # to 0 for a numeric field, which would drop IDs of 0
+        where = "TYPE IN ('AERIAL', 'BURIED') AND GISTOOL_ID IS NOT NULL"
+        if field_dtypes['GISTOOL_ID'] == 'object':
+            where += " AND GISTOOL_ID <> ''"
+        problem_segments = _read_where(
+            seg_path,
+            where,
+            columns=required_cols,
+            mask=problem_mask
+        )
         
         if not problem_segments.empty:
             output.append("\nIssues found in UsedSegments:")
@@ -200,8 +411,8 @@ def check_gistool_id(workspace):
             output.append("GISTOOL_ID should be empty for aerial/buried segments:")
             output.append("Showing first 5 problematic segments:\n")
             
-            report = problem_segments[['TYPE', 'GISTOOL_ID', 'ID']].copy().head(5)
-            report['GISTOOL_ID'] = report['GISTOOL_ID'].apply(lambda x: f"'{x}'" if pd.notna(x) else '')
+            report = problem_segments[['TYPE', 'GISTOOL_ID', 'ID']].head(5).copy()
+            report['GISTOOL_ID'] = ("'" + report['GISTOOL_ID'].astype("string") + "'").fillna('')
             output.append(report[['TYPE', 'GISTOOL_ID', 'ID']].to_string(index=False))
             
             return True, "\n".join(output)
@@ -216,7 +427,7 @@ def check_gistool_id(workspace):
 
 
 ############################################################################################################
-def check_invalid_cable_refs(workspace):
+def check_invalid_cable_refs(workspace, cache=None):
     """
     Checks all cable piece shapefiles for invalid CableID references
     Returns: (has_issues, message) tuple
@@ -227,38 +438,48 @@ def check_invalid_cable_refs(workspace):
     try:
         cable_types = ["Feeder", "Drop", "PrimDistribution", "Distribution"]
         output.append("Checking CableID references for all cable types")
+        files = _workspace_files(workspace)
 
-        for layer in cable_types:
+        def check_layer(layer):
+            lines = []
             cable_file = f"OUT_{layer}Cables.shp"
             piece_file = f"OUT_{layer}CablePieces.shp"
             cable_path = os.path.join(workspace, cable_file)
             piece_path = os.path.join(workspace, piece_file)
 
-            if not os.path.exists(cable_path):
-                output.append(f"Cable file missing: {cable_file}")
-                continue
-            if not os.path.exists(piece_path):
-                output.append(f"Cable piece file missing: {piece_file}")
-                continue
+            if cable_file not in files:
+                return False, [f"Cable file missing: {cable_file}"]
+            if piece_file not in files:
+                return False, [f"Cable piece file missing: {piece_file}"]
 
-            cables = gpd.read_file(cable_path)
-            pieces = gpd.read_file(piece_path)
+            cables = _read_shapefile(cable_path, cache, columns=["CABLE_ID"], read_geometry=False)
+            valid_ids = cables["CABLE_ID"]
 
-            # Check for invalid CableID references
-            valid_ids = set(cables["CABLE_ID"])
-            invalid_pieces = pieces[~pieces["CABLE_ID"].isin(valid_ids)]
+            # Check for invalid CableID references, streaming the (much larger)
+            # pieces layer so only the invalid IDs are kept in memory
+            invalid_batches = []
+            for piece_ids in _iter_column(piece_path, "CABLE_ID"):
+                invalid = piece_ids[~piece_ids.isin(valid_ids)]
+                if not invalid.empty:
+                    invalid_batches.append(invalid)
 
-            if invalid_pieces.empty:
-                output.append(f"{layer}CablePieces: All CABLE_IDs are valid.")
+            if not invalid_batches:
+                lines.append(f"{layer}CablePieces: All CABLE_IDs are valid.")
             else:
-                has_issues = True
+                invalid_pieces = pd.concat(invalid_batches, ignore_index=True)
                 invalid_count = len(invalid_pieces)
-                invalid_ids = invalid_pieces["CABLE_ID"].unique()
-                output.append(f"{layer}CablePieces: Found {invalid_count} pieces with {len(invalid_ids)} invalid CableIDs")
-                output.append("Invalid CableIDs: " + ", ".join(map(str, invalid_ids[:10])))
+                invalid_ids = pd.unique(invalid_pieces.to_numpy())
+                lines.append(f"{layer}CablePieces: Found {invalid_count} pieces with {len(invalid_ids)} invalid CableIDs")
+                lines.append("Invalid CableIDs: " + ", ".join(map(str, invalid_ids[:10])))
                 if len(invalid_ids) > 10:
-                    output.append(f"Showing first 10 of {len(invalid_ids)} invalid IDs")
-            output.append("-" * 60)
+                    lines.append(f"Showing first 10 of {len(invalid_ids)} invalid IDs")
+            lines.append("-" * 60)
+            return bool(invalid_batches), lines
+
+        # Layers are checked concurrently, output is assembled in layer order
+        for layer_issues, lines in _map_files(check_layer, cable_types):
+            has_issues = has_issues or layer_issues
+            output.extend(lines)
         
         return has_issues, "\n".join(output)
         
@@ -270,7 +491,7 @@ def check_invalid_cable_refs(workspace):
 
 #############################################################################################################
 
-def report_splice_counts_by_closure(workspace):
+def report_splice_counts_by_closure(workspace, cache=None):
     """
     Reports the number of splices per closure and checks against maximum limits
     Returns: tuple (has_issues, message)
@@ -278,61 +499,54 @@ def report_splice_counts_by_closure(workspace):
     output = []
     has_issues = False
     
-    # Define maximum splice limits for each closure type
-    MAX_SPLICE_LIMITS = {
-        "BE16": 840,
-        "flat_dis": 288,
-        "OFDC": 96,
-        "Budi-S 9-48 HP": 48,
-        "POC_UG_1-8HP": 8,
-        "Budi-S 49-72 HP": 72
-    }
-    
     try:
         closure_file = os.path.join(workspace, "OUT_Closures.shp")
         splice_file = os.path.join(workspace, "OUT_Splices.shp")
         output.append("🔍 Reporting splices per closure type")
+        files = _workspace_files(workspace)
         
-        if not os.path.exists(closure_file):
+        if "OUT_Closures.shp" not in files:
             output.append("Error: OUT_Closures.shp not found")
             return None, "\n".join(output)
-        if not os.path.exists(splice_file):
+        if "OUT_Splices.shp" not in files:
             output.append("Error: OUT_Splices.shp not found")
             return None, "\n".join(output)
         
-        closures = gpd.read_file(closure_file)
-        splices = gpd.read_file(splice_file)
-        
-        # Count splices per closure ID
-        splice_counts = splices["ID"].value_counts().reset_index()
-        splice_counts.columns = ["ID", "SpliceCount"]
-        
-        # Merge counts into closures
-        closures["ID"] = closures["ID"].astype(str)
-        splice_counts["ID"] = splice_counts["ID"].astype(str)
-        
-        report_df = closures[["IDENTIFIER", "ID"]].copy()
-        report_df = report_df.merge(splice_counts, on="ID", how="left")
+        closures = _read_shapefile(closure_file, cache, columns=['IDENTIFIER', 'ID'], read_geometry=False)
+        splices = _read_shapefile(splice_file, cache, columns=['ID'], read_geometry=False)
+        
+        # Count splices per closure ID (unsorted, the join below sets the order)
+        splice_counts = splices["ID"].value_counts(sort=False).rename("SpliceCount")
+        
+        # Join counts onto closures (assign copies, closures may be shared via the cache).
+        # IDs are joined as-is when both layers store them with the same dtype and
+        # only compared as strings when they differ
+        closure_ids = closures["ID"]
+        if closure_ids.dtype != splices["ID"].dtype:
+            closure_ids = closure_ids.astype(str)
+            splice_counts.index = splice_counts.index.astype(str)
+        report_df = closures[["IDENTIFIER", "ID"]].assign(ID=closure_ids)
+        report_df = report_df.join(splice_counts, on="ID")
         report_df["SpliceCount"] = report_df["SpliceCount"].fillna(0).astype(int)
         
-        # Find closures that exceed their maximum splice count
-        problematic_closures = []
-        
-        for _, row in report_df.iterrows():
-            identifier = row['IDENTIFIER'] if pd.notnull(row['IDENTIFIER']) else 'N/A'
-            closure_id = str(row['ID']) if pd.notnull(row['ID']) else 'N/A'
-            splice_count = row['SpliceCount']
-            
-            # Check if this closure type has a defined limit
-            if identifier in MAX_SPLICE_LIMITS:
-                max_limit = MAX_SPLICE_LIMITS[identifier]
-                if splice_count > max_limit:
-                    problematic_closures.append({
-                        'identifier': identifier,
-                        'closure_id': closure_id,
-                        'splice_count': splice_count,
-                        'max_limit': max_limit
-                    })
+        # Find closures that exceed their maximum splice count. Limits are looked
+        # up once per closure type via the categorical codes; types without a
+        # defined limit (and null IDENTIFIERs, code -1) get NaN and never compare greater
+        identifiers = report_df["IDENTIFIER"].astype("category")
+        type_limits = np.append(identifiers.cat.categories.map(SPLICE_LIMITS).to_numpy(dtype=float), np.nan)
+        max_limits = type_limits[identifiers.cat.codes.to_numpy()]
+        report_df["max_limit"] = max_limits
+        exceeding = report_df[report_df["SpliceCount"].to_numpy() > max_limits]
+        
+        problematic_closures = [
+            {
+                'identifier': row.IDENTIFIER,
+                'closure_id': str(row.ID),
+                'splice_count': row.SpliceCount,
+                'max_limit': int(row.max_limit)
+            }
+            for row in exceeding.itertuples(index=False)
+        ]
         
         # Report results - MAINTAIN ORIGINAL OUTPUT FORMAT
         if problematic_closures:
@@ -357,7 +571,7 @@ def report_splice_counts_by_closure(workspace):
 
 #################################################################################################
 
-def check_cluster_overlaps(workspace, cluster_files=None):
+def check_cluster_overlaps(workspace, cluster_files=None, cache=None):
     """
     Detects overlapping features within each cluster layer shapefile.
     Returns: (has_issues: bool, message: str)
@@ -378,41 +592,43 @@ def check_cluster_overlaps(workspace, cluster_files=None):
                 "OUT_FeederCableClusters.shp"
             ]
 
-        issues_found = False
-        for file in cluster_files:
+        files = _workspace_files(workspace)
+
+        def check_file(file):
             path = os.path.join(workspace, file)
-            if not os.path.isfile(path):
-                output.append(f"⚠️ File not found: {file}")
-                continue
+            if file not in files:
+                return False, [f"⚠️ File not found: {file}"]
 
-            gdf = gpd.read_file(path)
+            lines = []
+            id_col = "CAB_GROUP" if "CableClusters" in file else "AGG_ID"
+            gdf = _read_shapefile(path, cache, columns=[id_col])
             gdf = gdf[gdf.geometry.notnull()].reset_index(drop=True)
 
-            overlaps = []
-            # spatial index for performance
-            sindex = gdf.sindex
-            for idx, geom in gdf.geometry.items():
-                candidates = sindex.query(geom, predicate="intersects")
-                for j in candidates:
-                    if idx < j and geom.intersects(gdf.geometry[j]):
-                        overlaps.append((idx, j))
+            # one bulk spatial index query returns all intersecting (i, j) pairs
+            left, right = gdf.sindex.query(gdf.geometry, predicate="intersects")
+            keep = left < right
+            order = np.lexsort((right[keep], left[keep]))
+            left, right = left[keep][order], right[keep][order]
 
-            if overlaps:
-                issues_found = True
-                output.append(f"{file}: {len(overlaps)} overlaps found:")
-                for a, b in overlaps[:5]:
+            if len(left):
+                ids = gdf[id_col].to_numpy() if id_col in gdf.columns else np.arange(len(gdf))
+                lines.append(f"{file}: {len(left)} overlaps found:")
+                for a, b in zip(left[:5], right[:5]):
                     if "CableClusters" in file:
-                        id_a = gdf.loc[a].get("CAB_GROUP", a)
-                        id_b = gdf.loc[b].get("CAB_GROUP", b)
-                        output.append(f"   • Cluster CAB_GROUP {id_a} overlaps with CAB_GROUP {id_b}")
+                        lines.append(f"   • Cluster CAB_GROUP {ids[a]} overlaps with CAB_GROUP {ids[b]}")
                     else:
-                        id_a = gdf.loc[a].get("AGG_ID", a)
-                        id_b = gdf.loc[b].get("AGG_ID", b)
-                        output.append(f"   • Cluster AGG_ID {id_a} overlaps with Cluster AGG_ID {id_b}")
+                        lines.append(f"   • Cluster AGG_ID {ids[a]} overlaps with Cluster AGG_ID {ids[b]}")
             else:
-                output.append(f"{file}: No overlaps detected.")
+                lines.append(f"{file}: No overlaps detected.")
 
-            output.append("-" * 60)
+            lines.append("-" * 60)
+            return bool(len(left)), lines
+
+        # Cluster layers are checked concurrently, output is assembled in file order
+        issues_found = False
+        for file_issues, lines in _map_files(check_file, cluster_files):
+            issues_found = issues_found or file_issues
+            output.extend(lines)
 
         return issues_found, "\n".join(output)
 
@@ -423,7 +639,7 @@ def check_cluster_overlaps(workspace, cluster_files=None):
 
 #################################################################################################
 
-def check_granularity_fields(workspace):
+def check_granularity_fields(workspace, cache=None):
     """
     Validates that CABLEGRAN and BUNDLEGRAN fields are not set to -1 
     in all OUT_<Layer>Cables.shp files.
@@ -435,33 +651,44 @@ def check_granularity_fields(workspace):
     output = ["Checking CABLEGRAN and BUNDLEGRAN values in cable layers...\n"]
     try:
         cable_layers = ["Feeder", "Drop", "Distribution", "PrimDistribution"]
-        issues_found = False
+        files = _workspace_files(workspace)
 
-        for layer in cable_layers:
+        def check_layer(layer):
             file_name = f"OUT_{layer}Cables.shp"
             path = os.path.join(workspace, file_name)
-            if not os.path.isfile(path):
-                output.append(f"Missing: {file_name}")
-                continue
-
-            gdf = gpd.read_file(path)
-            if 'CABLEGRAN' not in gdf.columns or 'BUNDLEGRAN' not in gdf.columns:
-                output.append(f"{file_name} is missing CABLEGRAN or BUNDLEGRAN fields.")
-                issues_found = True
-                continue
-
-            invalid = gdf[(gdf['CABLEGRAN'] == -1) | (gdf['BUNDLEGRAN'] == -1)]
+            if file_name not in files:
+                return False, [f"Missing: {file_name}"]
+
+            fields = _fields(path)
+            if 'CABLEGRAN' not in fields or 'BUNDLEGRAN' not in fields:
+                return True, [f"{file_name} is missing CABLEGRAN or BUNDLEGRAN fields."]
+
+            lines = []
+            # Only rows with an invalid granularity are read
+            invalid = _read_where(
+                path,
+                "CABLEGRAN = -1 OR BUNDLEGRAN = -1",
+                columns=['CABLE_ID', 'CABLEGRAN', 'BUNDLEGRAN'],
+                mask=lambda gdf: (gdf['CABLEGRAN'] == -1) | (gdf['BUNDLEGRAN'] == -1),
+                recheck=False
+            )
             if not invalid.empty:
-                issues_found = True
                 count = len(invalid)
-                output.append(f"{file_name}: {count} invalid rows:")
+                lines.append(f"{file_name}: {count} invalid rows:")
                 # show up to 5 rows
                 preview = invalid[['CABLE_ID', 'CABLEGRAN', 'BUNDLEGRAN']].head(5)
-                output.append(preview.to_string(index=False))
+                lines.append(preview.to_string(index=False))
             else:
-                output.append(f"{file_name}: All granularity values are valid.")
+                lines.append(f"{file_name}: All granularity values are valid.")
+
+            lines.append("-" * 60)
+            return not invalid.empty, lines
 
-            output.append("-" * 60)
+        # Layers are checked concurrently, output is assembled in layer order
+        issues_found = False
+        for layer_issues, lines in _map_files(check_layer, cable_layers):
+            issues_found = issues_found or layer_issues
+            output.extend(lines)
 
         return issues_found, "\n".join(output)
 
@@ -475,12 +702,13 @@ def check_granularity_fields(workspace):
 
 ######################################################################################################
 
-def validate_non_virtual_closures(workspace):
+def validate_non_virtual_closures(workspace, cache=None):
     """
     Validates that PrimDistribution, Distribution, and Drop closures are not virtual.
     
     Args:
         workspace (str): Path to Comsof output directory
+        cache (ShapefileCache): Optional cache shared with other checks
         
     Returns:
         tuple: (has_issues, message) where:
@@ -492,25 +720,29 @@ def validate_non_virtual_closures(workspace):
     output = ["🔍 Validating non-virtual closures..."]
     try:
         closure_path = os.path.join(workspace, "OUT_Closures.shp")
-        if not os.path.isfile(closure_path):
+        if "OUT_Closures.shp" not in _workspace_files(workspace):
             output.append(f"Error: OUT_Closures.shp not found in {workspace}")
             return None, "\n".join(output)
 
-        closures = gpd.read_file(closure_path)
-
         # Check required columns
         required_cols = ['LAYER', 'VIRTUAL', 'EQ_ID']
-        missing = [c for c in required_cols if c not in closures.columns]
+        fields = _fields(closure_path)
+        missing = [c for c in required_cols if c not in fields]
         if missing:
             output.append(f"Error: Missing required columns: {', '.join(missing)}")
             return None, "\n".join(output)
 
-        # Find closures of the given types that are marked virtual (VIRTUAL == 1)
-        mask = (
-            closures['LAYER'].isin(['PrimDistribution', 'Distribution', 'Drop']) &
-            (closures['VIRTUAL'] == 1)
+        # Find closures of the given types that are marked virtual (VIRTUAL == 1);
+        # only those rows are read
+        bad = _read_where(
+            closure_path,
+            "VIRTUAL = 1 AND LAYER IN ('PrimDistribution', 'Distribution', 'Drop')",
+            columns=required_cols,
+            mask=lambda closures: (
+                closures['LAYER'].isin(['PrimDistribution', 'Distribution', 'Drop']) &
+                (closures['VIRTUAL'] == 1)
+            )
         )
-        bad = closures[mask]
 
         if not bad.empty:
             output.append(f"Found {len(bad)} closures incorrectly marked as virtual:")
@@ -519,8 +751,10 @@ def validate_non_virtual_closures(workspace):
             output.append("- Distribution")
             output.append("- Drop\n")
 
-            # Report using EQ_ID
-            report = bad[['EQ_ID', 'LAYER', 'VIRTUAL']].copy()
+            # Report using EQ_ID, only the first 5 rows are formatted
+            if len(bad) > 5:
+                output.append(f"Showing first 5 of {len(bad)} closures:")
+            report = bad[['EQ_ID', 'LAYER', 'VIRTUAL']].head(5).copy()
             report['VIRTUAL'] = report['VIRTUAL'].astype(int)
             output.append(report.to_string(index=False))
             has_issues = True
@@ -537,7 +771,7 @@ def validate_non_virtual_closures(workspace):
 #######################################################################################################
 
 
-def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
+def validate_feeder_primdistribution_locations(workspace, tolerance=0.01, cache=None):
     """
     Validates critical point locations:
     1. Feeder Point and Primary Distribution Point should be separated
@@ -546,6 +780,7 @@ def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
     Args:
         workspace (str): Path to Comsof output directory
         tolerance (float): Maximum allowed distance between points (in CRS units)
+        cache (ShapefileCache): Optional cache shared with other checks
         
     Returns:
         tuple: (has_issues, message) where:
@@ -561,6 +796,7 @@ def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
         feeder_path = os.path.join(workspace, "OUT_FeederPoints.shp")
         prim_path = os.path.join(workspace, "OUT_PrimDistributionPoints.shp")
         dist_path = os.path.join(workspace, "OUT_DistributionPoints.shp")
+        files = _workspace_files(workspace)
         
         output.append("\n🔍 Validating critical point locations...")
         
@@ -570,17 +806,17 @@ def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
         output.append("\n=== Feeder Point vs Primary Distribution Point ===")
         
         # Check if files exist
-        if not os.path.exists(feeder_path):
+        if "OUT_FeederPoints.shp" not in files:
             output.append("Error: OUT_FeederPoints.shp not found")
             all_issues.append("feeder_missing")
-        if not os.path.exists(prim_path):
+        if "OUT_PrimDistributionPoints.shp" not in files:
             output.append("Error: OUT_PrimDistributionPoints.shp not found")
             all_issues.append("prim_missing")
         
         if "feeder_missing" not in all_issues and "prim_missing" not in all_issues:
             # Load shapefiles
-            feeder_points = gpd.read_file(feeder_path)
-            prim_points = gpd.read_file(prim_path)
+            feeder_points = _read_shapefile(feeder_path, cache)
+            prim_points = _read_shapefile(prim_path, cache)
             
             # Check if files have points
             if len(feeder_points) == 0:
@@ -619,11 +855,11 @@ def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
         output.append("\n=== Distribution Points vs Primary Distribution Points ===")
         
         # Check if distribution points file exists
-        if not os.path.exists(dist_path):
+        if "OUT_DistributionPoints.shp" not in files:
             output.append("Error: OUT_DistributionPoints.shp not found")
             all_issues.append("dist_missing")
         else:
-            dist_points = gpd.read_file(dist_path)
+            dist_points = _read_shapefile(dist_path, cache)
             
             if len(dist_points) == 0:
                 output.append("Validation passed - Distribution Points file is empty")
@@ -632,42 +868,38 @@ def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
                 if "prim_missing" in all_issues or "prim_empty" in all_issues:
                     output.append("Cannot perform validation - Primary Distribution Points are missing or empty")
                 else:
-                    # Create spatial index for prim points for efficient searching
-                    prim_sindex = prim_points.sindex
+                    # Find every (distribution, prim) pair within tolerance in one
+                    # bulk spatial index query instead of a per-point loop
+                    dist_geoms = np.asarray(dist_points.geometry)
+                    prim_geoms = np.asarray(prim_points.geometry)
+                    tree = shapely.STRtree(prim_geoms)
+                    dist_idx, prim_idx = tree.query(dist_geoms, predicate="dwithin", distance=tolerance)
+                    distances = shapely.distance(dist_geoms[dist_idx], prim_geoms[prim_idx])
+                    close = distances < tolerance
+                    dist_idx, prim_idx, distances = dist_idx[close], prim_idx[close], distances[close]
                     
-                    # Find distribution points too close to any prim point
-                    problem_points = []
+                    # Only need one violation per distribution point
+                    order = np.lexsort((prim_idx, dist_idx))
+                    dist_idx, first = np.unique(dist_idx[order], return_index=True)
+                    prim_idx, distances = prim_idx[order][first], distances[order][first]
                     
-                    for idx, dist_row in dist_points.iterrows():
-                        dist_geom = dist_row.geometry
-                        
-                        # Find possible matches using spatial index
-                        possible_matches_index = list(prim_sindex.intersection(dist_geom.bounds))
-                        possible_matches = prim_points.iloc[possible_matches_index]
-                        
-                        # Check exact distance to each possible match
-                        for _, prim_row in possible_matches.iterrows():
-                            distance = dist_geom.distance(prim_row.geometry)
-                            if distance < tolerance:
-                                problem_points.append({
-                                    'dist_id': dist_row.get('ID', idx),
-                                    'dist_coords': (dist_geom.x, dist_geom.y),
-                                    'prim_id': prim_row.get('ID', 'Unknown'),
-                                    'distance': distance
-                                })
-                                break  # Only need one violation per distribution point
-                    
-                    if problem_points:
+                    if len(dist_idx):
                         has_issues = True
-                        output.append(f"\nPROBLEM: Found {len(problem_points)} Distribution Points too close to Primary Distribution Points")
+                        output.append(f"\nPROBLEM: Found {len(dist_idx)} Distribution Points too close to Primary Distribution Points")
                         output.append(f"Maximum allowed distance: {tolerance} units")
                         output.append("\nProblematic Distribution Points (first 5):")
                         
-                        # Show first 5 problems
-                        for point in problem_points[:5]:
-                            output.append(f"  Distribution Point ID: {point['dist_id']}")
-                            output.append(f"    Coordinates: X={point['dist_coords'][0]:.6f}, Y={point['dist_coords'][1]:.6f}")
-                            output.append(f"    Distance to Primary Point ({point['prim_id']}): {point['distance']:.6f} units")
+                        # Only the first 5 problems are looked up and formatted
+                        shown_dist, shown_prim, shown_distances = dist_idx[:5], prim_idx[:5], distances[:5]
+                        dist_ids = dist_points["ID"].to_numpy()[shown_dist] if "ID" in dist_points.columns else dist_points.index.to_numpy()[shown_dist]
+                        prim_ids = prim_points["ID"].to_numpy()[shown_prim] if "ID" in prim_points.columns else ['Unknown'] * len(shown_prim)
+                        xs = shapely.get_x(dist_geoms[shown_dist])
+                        ys = shapely.get_y(dist_geoms[shown_dist])
+                        
+                        for dist_id, prim_id, x, y, distance in zip(dist_ids, prim_ids, xs, ys, shown_distances):
+                            output.append(f"  Distribution Point ID: {dist_id}")
+                            output.append(f"    Coordinates: X={x:.6f}, Y={y:.6f}")
+                            output.append(f"    Distance to Primary Point ({prim_id}): {distance:.6f} units")
                             output.append("")
                     else:
                         output.append("\nValidation passed - No Distribution Points too close to Primary Distribution Points")
@@ -679,12 +911,13 @@ def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
         return None, "\n".join(output)
 
 #######################################################################################################
-def validate_cable_diameters(workspace):
+def validate_cable_diameters(workspace, cache=None):
     """
     Validates that DIAMETER column is not empty or zero in cable shapefiles.
     
     Args:
         workspace (str): Path to Comsof output directory
+        cache (ShapefileCache): Optional cache shared with other checks
         
     Returns:
         tuple: (has_issues, message) where:
@@ -702,17 +935,18 @@ def validate_cable_diameters(workspace):
     try:
         output.append("\nValidating cable diameters...")
         any_errors = False
+        files = _workspace_files(workspace)
         
         for file in cable_files:
             file_path = os.path.join(workspace, file)
             file_errors = False
             
-            if not os.path.exists(file_path):
+            if file not in files:
                 output.append(f"Error: {file} not found in workspace")
                 any_errors = True
                 continue
                 
-            gdf = gpd.read_file(file_path)
+            gdf = _read_shapefile(file_path, cache, columns=['CABLE_ID', 'DIAMETER'], read_geometry=False)
             
             if 'DIAMETER' not in gdf.columns:
                 output.append(f"Error: {file} is missing DIAMETER column")
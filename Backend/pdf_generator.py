@@ -1,212 +1,46 @@
 # pdf_generator.py
-import io
 import os
+import json
+import hashlib
 import datetime
+import functools
+import threading
+import multiprocessing
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from flask import Response
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+from jinja2.filters import do_title
 from weasyprint import HTML, CSS
 from weasyprint.text.fonts import FontConfiguration
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter
+json_loads = orjson.loads if orjson else json.loads
 
-class ValidationReportGenerator:
-    """
-    Handles the generation of professional PDF validation reports using HTML/CSS.
-    """
+TEMPLATE_NAME = "validation_report.html"
+TEMPLATE_CSS_NAME = "validation_report.css"  # Template styles, parsed once instead of per render
+PDF_CACHE_SIZE = 32  # Rendered reports kept for repeated exports of the same results
 
-    def __init__(self, app_root_path: str | None = None):
-        """
-        Initialise the PDF generator.
+_pdf_cache = OrderedDict()
+_pdf_cache_lock = threading.Lock()
 
-        Args:
-            app_root_path: The directory that contains the ``templates`` folder.
-                           If omitted, the current working directory is used.
-        """
-        if app_root_path is None:
-            app_root_path = os.getcwd()
-
-        # Templates are expected in a sub‑folder named ``templates``.
-        self.template_dir = os.path.join(app_root_path, "templates")
-        if not os.path.isdir(self.template_dir):
-            raise FileNotFoundError(f"Template directory not found: {self.template_dir!r}")
+# 'inline' (default) converts HTML to PDF in the request thread; 'process'
+# hands the WeasyPrint step to a process pool sized to the CPU count
+PDF_EXECUTOR = os.environ.get("PDF_EXECUTOR", "inline").lower()
 
-        self.env = Environment(loader=FileSystemLoader(self.template_dir))
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
 
-    # ------------------------------------------------------------------
-    # Public API – the Flask view helper
-    # ------------------------------------------------------------------
-    def generate_pdf_response(self, data: dict) -> Response:
-        """
-        Create a Flask Response that streams the PDF to the client.
-
-        Args:
-            data: Must contain ``filename`` and ``results`` keys.
-
-        Returns:
-            flask.Response holding the PDF.
-        """
-        try:
-            pdf_bytes = self._create_pdf_buffer(data)
-
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_name = os.path.splitext(data.get("filename", "report"))[0]
-            pdf_name = f"{base_name}_validation_report_{timestamp}.pdf"
-
-            return Response(
-                pdf_bytes,
-                mimetype="application/pdf",
-                headers={
-                    "Content-Disposition": f"attachment; filename={pdf_name}"
-                },
-            )
-        except Exception as exc:
-            raise RuntimeError(f"PDF generation failed: {exc}") from exc
+# Keys of a formatted result that a message dict may already provide
+_RESULT_FIELDS = frozenset(("status", "summary", "details", "errors"))
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-    def _create_pdf_buffer(self, data: dict) -> bytes:
-        """
-        Render the template and convert it to PDF bytes.
 
-        Returns:
-            PDF file contents as bytes.
-        """
-        # Get or compute the stats
-        stats = data.get("summary", self._calculate_stats(data["results"]))
-        
-        # Convert results to consistent format for template
-        results = data["results"]
-        formatted_results = []
-        
-        for result in results:
-            if isinstance(result, (list, tuple)):
-                # Handle complex nested structure where result[2] might be a dict
-                name = str(result[0]) if len(result) > 0 else "Unknown Check"
-                status = result[1] if len(result) > 1 else None
-                
-                # If the third element is a dict, it's already in our new format
-                if len(result) > 2 and isinstance(result[2], dict):
-                    message_data = result[2]
-                    formatted_results.append({
-                        "check_name": name,
-                        "status": message_data.get("status", 
-                            "passed" if status is False else "failed" if status is True else "error"),
-                        "summary": message_data.get("summary", {"message": "No details available"}),
-                        "details": message_data.get("details", []),
-                        "errors": message_data.get("errors", [])
-                    })
-                else:
-                    # Handle simple string message or missing message
-                    message = str(result[2]) if len(result) > 2 else "No details available"
-                    formatted_results.append({
-                        "check_name": name,
-                        "status": "passed" if status is False else "failed" if status is True else "error",
-                        "summary": {"message": message},
-                        "details": [],
-                        "errors": []
-                    })
-            else:
-                # Result is already in dictionary format
-                formatted_results.append(result)
-        
-        # Build the Jinja2 context
-        context = {
-            "report_title": "Comsof Validation Report",
-            "filename": data.get("filename", "Unknown"),
-            "generation_date": data.get("summary", {}).get("completion_date", 
-                datetime.datetime.now().strftime("%B %d, %Y at %H:%M:%S")),
-            "results": formatted_results,
-            "stats": {
-                "total_checks": stats.get("total_tests", stats.get("total_checks", 0)),
-                "passed_checks": stats.get("passed", stats.get("passed_checks", 0)),
-                "failed_checks": stats.get("failed", stats.get("failed_checks", 0)),
-                "error_checks": stats.get("errors", stats.get("error_checks", 0)),
-                "completion_percentage": stats.get("completion_percentage", 100.0)
-            },
-        }
-
-        # Grab the template
-        template = self.env.get_template("validation_report.html")
-        html_content = template.render(context)
-
-        # Convert the HTML to PDF
-        pdf_buffer = io.BytesIO()
-        font_config = FontConfiguration()
-
-        HTML(string=html_content).write_pdf(
-            target=pdf_buffer,
-            font_config=font_config,
-            stylesheets=[CSS(string=self._get_css_styles())],
-        )
-
-        # Return the raw bytes, not the BytesIO object
-        return pdf_buffer.getvalue()
-
-    def _calculate_stats(self, results: list) -> dict:
-        """
-        Compute statistics for the report.
-        
-        Handles both formats:
-        1. List of tuples: [(name, status, message), ...]
-        2. List of dicts: [{"check_name": str, "status": str, ...}, ...]
-        
-        For tuple format:
-        - status True → failed
-        - status False → passed
-        - status None → error
-        
-        For dict format:
-        - status "failed" → failed
-        - status "passed" → passed
-        - status "error" → error
-        """
-        total = len(results)
-        
-        # Detect format (tuple or dict)
-        if results and isinstance(results[0], (list, tuple)):
-            # Old tuple format - safely get status from index 1 if available
-            passed = sum(1 for r in results if len(r) > 1 and r[1] is False)
-            failed = sum(1 for r in results if len(r) > 1 and r[1] is True)
-            errors = sum(1 for r in results if len(r) <= 1 or r[1] is None)
-            completion = (
-                round(
-                    sum(1 for r in results if len(r) > 1 and r[1] is not None)
-                    / total
-                    * 100,
-                    1,
-                )
-                if total
-                else 0.0
-            )
-        else:
-            # New dict format
-            passed = sum(1 for result in results if result.get("status") == "passed")
-            failed = sum(1 for result in results if result.get("status") == "failed")
-            errors = sum(1 for result in results if result.get("status") == "error")
-            completion = (
-                round(
-                    sum(1 for result in results if result.get("status") != "error")
-                    / total
-                    * 100,
-                    1,
-                )
-                if total
-                else 0.0
-            )
-
-        return {
-            "total_checks": total,
-            "passed_checks": passed,
-            "failed_checks": failed,
-            "error_checks": errors,
-            "completion_percentage": completion,
-        }
-
-    def _get_css_styles(self) -> str:
-        """
-        Return the full CSS string that styles the PDF report.
-        """
-        return """
+# Stylesheet for the PDF report
+REPORT_CSS = """
             @page {
                 size: A4;
                 margin: 1cm;
@@ -324,7 +158,7 @@ class ValidationReportGenerator:
                 overflow:hidden;
             }
             .progress-fill{
-                height:100%;background:linear-gradient(90deg,#1976d2,#2196f3);
+                height:100%;background:#1976d2;
                 border-radius:5px;
             }
             .progress-percentage{
@@ -386,6 +220,503 @@ class ValidationReportGenerator:
             }
         """
 
+
+_thread_stylesheets = threading.local()
+
+
+def _stylesheets(template_dir: str):
+    """
+    Parse the report CSS and set up fonts once per thread; WeasyPrint reuses
+    both for every render on that thread. FontConfiguration wraps a Pango/
+    fontconfig font map that WeasyPrint does not lock, so threads never share
+    one. Returns (font_config, stylesheets).
+
+    The template's stylesheet used to be inline, at author origin, where it
+    beat REPORT_CSS; passed to write_pdf it is user origin like REPORT_CSS.
+    Both are therefore parsed as one sheet with the template rules last, so
+    they keep winning. This relies on template selectors being at least as
+    specific as the REPORT_CSS rules they override, which holds for
+    single-class and descendant selectors.
+    """
+    cache = getattr(_thread_stylesheets, "by_dir", None)
+    if cache is None:
+        cache = _thread_stylesheets.by_dir = {}
+    if template_dir not in cache:
+        font_config = FontConfiguration()
+        css = REPORT_CSS
+        template_css = os.path.join(template_dir, TEMPLATE_CSS_NAME)
+        if os.path.isfile(template_css):
+            with open(template_css, encoding="utf-8") as f:
+                css += "\n" + f.read()
+        cache[template_dir] = font_config, [CSS(string=css, font_config=font_config)]
+    return cache[template_dir]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_template(template_dir: str):
+    """
+    Compile the report template once per template directory and reuse it for
+    every report. The source is read once into a DictLoader, so template
+    lookups never touch the filesystem; restart the app to pick up template
+    edits. Compiled bytecode is kept in the temp directory so new workers
+    skip the compile.
+    """
+    with open(os.path.join(template_dir, TEMPLATE_NAME), encoding="utf-8") as f:
+        source = f.read()
+    env = Environment(
+        loader=DictLoader({TEMPLATE_NAME: source}),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+    return env.get_template(TEMPLATE_NAME)
+
+
+def _pdf_process_pool():
+    """Create the PDF process pool on first use (after gunicorn has forked)"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pdf_pool
+
+
+def _write_pdf(template_dir: str, html_content: str) -> bytes:
+    """
+    Convert rendered report HTML to PDF bytes. Runs in the request thread or
+    in a pool worker, which keeps its own parsed stylesheets between reports.
+    """
+    font_config, stylesheets = _stylesheets(template_dir)
+    return HTML(string=html_content).write_pdf(
+        font_config=font_config,
+        stylesheets=stylesheets,
+    )
+
+
+def _report_status(has_issues) -> str:
+    """
+    Report status of a tuple result's has_issues flag. Identity checks, not a
+    dict lookup: 1 and 0 hash like True and False but are reported as errors.
+    """
+    if has_issues is False:
+        return "passed"
+    if has_issues is True:
+        return "failed"
+    return "error"
+
+
+# Per-status markup for the results section
+_CHECK_CLASS = {"failed": "check-failed", "passed": "check-passed"}
+_FOOTER_TEXT = {
+    "failed": "Action Required: This check identified issues that need attention",
+    "passed": "Validation Passed: All criteria met successfully",
+}
+_ERROR_FOOTER_TEXT = "Check Error: This validation could not be completed"
+
+_MISSING = object()  # Stands in for a Jinja Undefined
+
+
+def _field(obj, name):
+    """obj[name] as the template would look it up, or _MISSING"""
+    try:
+        return obj[name]
+    except (TypeError, LookupError):
+        return _MISSING
+
+
+def _text(value) -> str:
+    """Template output of a value: missing values print as nothing"""
+    return "" if value is _MISSING else str(value)
+
+
+def _message_line_html(line: str) -> str:
+    """One line of a check message, highlighted the way the report template does"""
+    upper = line.upper()
+    if "CRITICAL" in upper or "ERROR" in upper:
+        return f'<div class="message-line critical-line"><i class="icon-critical"></i> {line} </div>'
+    if "WARNING" in upper or "PROBLEM" in upper:
+        return f'<div class="message-line warning-line"><i class="icon-warning"></i> {line} </div>'
+    if line.startswith("Node ID") or line.startswith("---") or "CAB_GROUP" in line or "AGG_ID" in line:
+        return f'<div class="message-line code-line"><i class="icon-code"></i> <code>{line}</code> </div>'
+    return f'<div class="message-line"><i class="icon-info"></i> {line} </div>'
+
+
+def _summary_html(summary) -> str:
+    """Markup of a check's summary block (message lines or structured data)"""
+    if summary is _MISSING or not summary:
+        return '<div class="message-line"><i class="icon-info"></i> No detailed information available </div>'
+
+    message = _field(summary, "message")
+    if isinstance(message, str):
+        return "".join(
+            _message_line_html(line) for line in message.split("\n") if line.strip()
+        )
+
+    has_issues = _field(summary, "has_issues")
+    if has_issues is _MISSING or not has_issues:
+        return '<div class="message-line"><i class="icon-info"></i> No issues found </div>'
+
+    parts = []
+    total_duplicates = _field(summary, "total_duplicates")
+    if total_duplicates is not _MISSING:
+        parts.append(
+            f'<div class="message-line warning-line"><i class="icon-warning"></i> '
+            f"Found {total_duplicates} duplicated entries </div>"
+        )
+    closures = _field(summary, "sample_closures")
+    if closures is not _MISSING and closures:
+        parts.append('<div class="code-line"><i class="icon-code"></i> Sample problematic closures: ')
+        for closure in closures:
+            parts.append(
+                f"<br>ID: {_text(_field(closure, 'ID'))}, "
+                f"Identifier: {_text(_field(closure, 'IDENTIFIER'))} "
+            )
+        parts.append("</div>")
+    return "".join(parts)
+
+
+def _results_html(results: list) -> str:
+    """
+    Markup of the detailed results section. Built with plain string joins
+    because Jinja's per-iteration scope dominates rendering for long result
+    lists; the output matches the loop the report template used to run.
+    """
+    parts = []
+    append = parts.append
+
+    for index, result in enumerate(results, 1):
+        status = _field(result, "status")
+        status_text = _text(status)
+        if not isinstance(status, str):
+            status = None
+
+        append(
+            f'<div class="check {_CHECK_CLASS.get(status, "check-error")}">'
+            f'<div class="check-header"><div class="check-info">'
+            f'<span class="check-number">{index}</span>'
+            f'<h3 class="check-title">{_text(_field(result, "check_name"))}</h3></div>'
+            f'<div class="status-container"><span class="status status-{status_text}">'
+            f'<i class="icon-{status_text}"></i> {do_title(status_text)} </span></div></div>'
+            f'<div class="check-content"><div class="check-message">'
+        )
+        append(_summary_html(_field(result, "summary")))
+        append("</div>")
+
+        details = _field(result, "details")
+        if details is not _MISSING and details:
+            append('<div class="details-section"><h4>Additional Details</h4>')
+            for detail in details:
+                osc_id = _field(detail, "osc_id")
+                if osc_id is not _MISSING:
+                    append(
+                        f'<div class="detail-item"><div class="code-line"><i class="icon-code"></i> '
+                        f'OSC ID: {osc_id}, Duplicate Count: {_text(_field(detail, "duplicate_count"))} '
+                        f"</div></div>"
+                    )
+                else:
+                    append(
+                        f'<div class="detail-item"><div class="message-line"><i class="icon-info"></i> '
+                        f"{detail} </div></div>"
+                    )
+            append("</div>")
+
+        errors = _field(result, "errors")
+        if errors is not _MISSING and errors:
+            append('<div class="errors-section"><h4>Errors</h4>')
+            for error in errors:
+                error_type = _field(error, "type")
+                if error_type is not _MISSING:
+                    text = f'{error_type}: {_text(_field(error, "message"))}'
+                else:
+                    text = error
+                append(
+                    f'<div class="error-item critical-line"><i class="icon-critical"></i> {text} </div>'
+                )
+            append("</div>")
+
+        append(
+            f'<div class="check-footer {status_text}-footer"><i class="icon-{status_text}"></i> '
+            f'<span class="footer-text">{_FOOTER_TEXT.get(status, _ERROR_FOOTER_TEXT)}</span>'
+            f"</div></div></div>"
+        )
+
+    return "".join(parts)
+
+
+class ValidationReportGenerator:
+    """
+    Handles the generation of professional PDF validation reports using HTML/CSS.
+    """
+
+    def __init__(self, app_root_path: str | None = None):
+        """
+        Initialise the PDF generator.
+
+        Args:
+            app_root_path: The directory that contains the ``templates`` folder.
+                           If omitted, the current working directory is used.
+        """
+        if app_root_path is None:
+            app_root_path = os.getcwd()
+
+        # Templates are expected in a sub‑folder named ``templates``.
+        self.template_dir = os.path.join(app_root_path, "templates")
+        if not os.path.isdir(self.template_dir):
+            raise FileNotFoundError(f"Template directory not found: {self.template_dir!r}")
+
+        self.template = _load_template(self.template_dir)
+        self.env = self.template.environment
+
+        # Whether the last _create_pdf_buffer call was served from the cache
+        self.cache_hit = False
+
+    # ------------------------------------------------------------------
+    # Public API – the Flask view helper
+    # ------------------------------------------------------------------
+    def generate_pdf_response(self, data: dict) -> Response:
+        """
+        Create a Flask Response that streams the PDF to the client.
+
+        Args:
+            data: Must contain ``filename`` and ``results`` keys.
+
+        Returns:
+            flask.Response holding the PDF.
+        """
+        try:
+            pdf_bytes = self._create_pdf_buffer(data)
+
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            base_name = os.path.splitext(data.get("filename", "report"))[0]
+            pdf_name = f"{base_name}_validation_report_{timestamp}.pdf"
+
+            return Response(
+                pdf_bytes,
+                mimetype="application/pdf",
+                headers={
+                    "Content-Disposition": f"attachment; filename={pdf_name}",
+                    "X-PDF-Cache": "hit" if self.cache_hit else "miss",
+                },
+            )
+        except Exception as exc:
+            raise RuntimeError(f"PDF generation failed: {exc}") from exc
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _create_pdf_buffer(self, data: dict) -> bytes:
+        """
+        Return the PDF bytes for ``data``, rendering only when the same payload
+        has not been rendered recently.
+
+        Returns:
+            PDF file contents as bytes.
+        """
+        key = self._cache_key(data)
+        if key is not None:
+            with _pdf_cache_lock:
+                pdf_bytes = _pdf_cache.get(key)
+                if pdf_bytes is not None:
+                    _pdf_cache.move_to_end(key)
+                    self.cache_hit = True
+                    return pdf_bytes
+
+        self.cache_hit = False
+        pdf_bytes = self._render_pdf(data)
+
+        if key is not None:
+            with _pdf_cache_lock:
+                _pdf_cache[key] = pdf_bytes
+                _pdf_cache.move_to_end(key)
+                while len(_pdf_cache) > PDF_CACHE_SIZE:
+                    _pdf_cache.popitem(last=False)
+        return pdf_bytes
+
+    def _cache_key(self, data: dict):
+        """
+        Content hash of the payload, or None when it cannot be serialized
+        canonically (the report is then rendered without caching).
+
+        Payloads without a completion date (what the frontend sends) are
+        stamped with the time of rendering, so their key also carries the
+        current day: repeat exports that day get the first render, stamped
+        with its time, and the next day renders afresh.
+        """
+        if "completion_date" in (data.get("summary") or {}):
+            day = None
+        else:
+            day = datetime.date.today().toordinal()
+        try:
+            if orjson is not None:
+                payload = orjson.dumps(
+                    data,
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                    default=str,
+                )
+            else:
+                payload = json.dumps(
+                    data, sort_keys=True, separators=(",", ":"), default=str
+                ).encode("utf-8")
+        except (TypeError, ValueError):
+            return None
+        return self.template_dir, day, hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _render_pdf(self, data: dict) -> bytes:
+        """
+        Render the template and convert it to PDF bytes.
+
+        Returns:
+            PDF file contents as bytes.
+        """
+        # Results may arrive still serialized as a JSON string
+        results = data["results"]
+        if isinstance(results, (str, bytes)):
+            results = json_loads(results)
+
+        # Use the supplied summary, only computing stats when there is none
+        stats = data["summary"] if "summary" in data else self._calculate_stats(results)
+        
+        # Convert results to consistent format for template. The format is
+        # detected once from the first result, as in _calculate_stats.
+        
+        if not results or not isinstance(results[0], (list, tuple)):
+            # Results are already in dictionary format
+            formatted_results = results
+        else:
+            formatted_results = []
+            append = formatted_results.append
+            
+            for result in results:
+                # Handle complex nested structure where result[2] might be a dict
+                size = len(result)
+                if size > 0:
+                    name = result[0]
+                    if type(name) is not str:
+                        name = str(name)
+                else:
+                    name = "Unknown Check"
+                
+                # If the third element is a dict, it's already in our new format
+                if size > 2 and isinstance(result[2], dict):
+                    message_data = result[2]
+                    if message_data.keys() >= _RESULT_FIELDS:
+                        # Nothing to fill in, only the name comes from the tuple
+                        append({**message_data, "check_name": name})
+                        continue
+                    if "status" in message_data:
+                        status = message_data["status"]
+                    else:
+                        status = _report_status(result[1] if size > 1 else None)
+                    append({
+                        "check_name": name,
+                        "status": status,
+                        "summary": message_data.get("summary", {"message": "No details available"}),
+                        "details": message_data.get("details", []),
+                        "errors": message_data.get("errors", [])
+                    })
+                else:
+                    # Handle simple string message or missing message
+                    if size > 2:
+                        message = result[2]
+                        if type(message) is not str:
+                            message = str(message)
+                    else:
+                        message = "No details available"
+                    append({
+                        "check_name": name,
+                        "status": _report_status(result[1] if size > 1 else None),
+                        "summary": {"message": message},
+                        "details": [],
+                        "errors": []
+                    })
+        
+        # Only format the current time when the summary carries no date
+        summary = data.get("summary") or {}
+        if "completion_date" in summary:
+            generation_date = summary["completion_date"]
+        else:
+            generation_date = datetime.datetime.now().strftime("%B %d, %Y at %H:%M:%S")
+
+        # Build the Jinja2 context
+        context = {
+            "report_title": "Comsof Validation Report",
+            "filename": data.get("filename", "Unknown"),
+            "generation_date": generation_date,
+            "results_html": _results_html(formatted_results),
+            "stats": {
+                "total_checks": stats.get("total_tests", stats.get("total_checks", 0)),
+                "passed_checks": stats.get("passed", stats.get("passed_checks", 0)),
+                "failed_checks": stats.get("failed", stats.get("failed_checks", 0)),
+                "error_checks": stats.get("errors", stats.get("error_checks", 0)),
+                "completion_percentage": stats.get("completion_percentage", 100.0)
+            },
+        }
+
+        html_content = self.template.render(context)
+
+        # Convert the HTML to PDF; without a target WeasyPrint returns the
+        # bytes directly, so there is no intermediate buffer to copy out of
+        if PDF_EXECUTOR == "process":
+            return _pdf_process_pool().submit(_write_pdf, self.template_dir, html_content).result()
+        return _write_pdf(self.template_dir, html_content)
+
+    def _calculate_stats(self, results: list) -> dict:
+        """
+        Compute statistics for the report.
+        
+        Handles both formats:
+        1. List of tuples: [(name, status, message), ...]
+        2. List of dicts: [{"check_name": str, "status": str, ...}, ...]
+        
+        For tuple format:
+        - status True → failed
+        - status False → passed
+        - status None → error
+        
+        For dict format:
+        - status "failed" → failed
+        - status "passed" → passed
+        - status "error" → error
+        """
+        total = len(results)
+        
+        # Detect format (tuple or dict), then count in a single pass
+        if results and isinstance(results[0], (list, tuple)):
+            # Old tuple format - safely get status from index 1 if available
+            passed = failed = errors = 0
+            for r in results:
+                status = r[1] if len(r) > 1 else None
+                if status is False:
+                    passed += 1
+                elif status is True:
+                    failed += 1
+                elif status is None:
+                    errors += 1
+        else:
+            # New dict format
+            counts = Counter(result.get("status") for result in results)
+            passed = counts["passed"]
+            failed = counts["failed"]
+            errors = counts["error"]
+
+        completion = round((total - errors) / total * 100, 1) if total else 0.0
+
+        return {
+            "total_checks": total,
+            "passed_checks": passed,
+            "failed_checks": failed,
+            "error_checks": errors,
+            "completion_percentage": completion,
+        }
+
+    def _get_css_styles(self) -> str:
+        """
+        Return the full CSS string that styles the PDF report.
+        """
+        return REPORT_CSS
+
 # ----------------------------------------------------------------------
 # Convenience wrapper for Flask views
 # ----------------------------------------------------------------------